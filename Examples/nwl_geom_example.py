@@ -1,4 +1,5 @@
 from pathlib import Path
+import numpy as np
 import parastell.parastell as ps
 from parastell.cubit_utils import tag_surface
 
@@ -39,9 +40,7 @@ strengths = stellarator.source_mesh.strengths
 
 filepath = Path(export_dir) / "source_strengths.txt"
 
-file = open(filepath, "w")
-for tet in strengths:
-    file.write(f"{tet}\n")
+np.savetxt(filepath, strengths, fmt="%.17g")
 
 # Export DAGMC neutronics H5M file
 stellarator.build_cubit_model(skip_imprint=True)
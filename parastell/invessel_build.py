@@ -172,15 +172,13 @@ class InVesselBuild(object):
             method="linear" if self.use_pydagmc else "pchip",
         )
 
-        interpolated_offset_mat = np.array(
-            [
-                [
-                    interpolator([np.rad2deg(phi), np.rad2deg(theta)])[0]
-                    for theta in self._poloidal_angles_exp
-                ]
-                for phi in self._toroidal_angles_exp
-            ]
+        # Evaluate the interpolant on the full expanded angle grid in one call
+        phi_grid, theta_grid = np.meshgrid(
+            np.rad2deg(self._toroidal_angles_exp),
+            np.rad2deg(self._poloidal_angles_exp),
+            indexing="ij",
         )
+        interpolated_offset_mat = interpolator((phi_grid, theta_grid))
 
         return interpolated_offset_mat
 
@@ -675,7 +673,7 @@ class Rib(object):
 
         norm = np.cross(plane_norm, tangent)
 
-        return normalize(norm)
+        return normalize(norm, out=norm)
 
     def calculate_loci(self):
         """Generates Cartesian point-loci for stellarator rib."""
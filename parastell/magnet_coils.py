@@ -18,7 +18,13 @@ from .cubit_utils import (
 # imported into this namespace, changes to the variable do not persist when
 # modified by calls to the imported functions
 from . import cubit_utils
-from .utils import read_yaml_config, filter_kwargs, reorder_loop, m2cm
+from .utils import (
+    read_yaml_config,
+    filter_kwargs,
+    reorder_loop,
+    downsample_loop,
+    m2cm,
+)
 
 export_allowed_kwargs = ["step_filename", "export_mesh", "mesh_filename"]
 
@@ -200,31 +206,30 @@ class MagnetSetFromFilaments(MagnetSet):
         instantiates Filament class objects.
         (Internal function not intended to be called externally)
         """
-        with open(self.coils_file, "r") as file:
-            data = file.readlines()[self.start_line :]
-
-        coords = []
-        self.filaments = []
-
-        for line in data:
-            columns = line.strip().split()
-
-            if columns[0] == "end":
-                break
+        # Parse all filament data in a single pass; the "end" line terminating
+        # the data block is treated as a comment
+        data = np.loadtxt(
+            self.coils_file,
+            skiprows=self.start_line,
+            usecols=(0, 1, 2, 3),
+            comments="end",
+        )
+        coords = data[:, :3] * self.scale
 
-            # Coil current
-            s = float(columns[3])
+        # Coil current s = 0 signals end of filament
+        end_indices = np.flatnonzero(data[:, 3] == 0)
+        start_indices = np.concatenate([[0], end_indices[:-1] + 1])
 
-            # s = 0 signals end of filament
-            if s != 0:
-                coords.append(
-                    [float(ord) * self.scale for ord in columns[0:3]]
-                )
+        # Close each filament loop by replacing its terminating point with its
+        # first point
+        coords[end_indices] = coords[start_indices]
 
-            else:
-                coords.append(coords[0])
-                self.filaments.append(Filament(np.array(coords)))
-                coords.clear()
+        self.filaments = [
+            Filament(filament_coords)
+            for filament_coords in np.split(
+                coords[: end_indices[-1] + 1], end_indices[:-1] + 1
+            )
+        ]
 
     def sort_filaments_toroidally(self):
         """Reorders list of filaments by toroidal angle on range [-pi, pi].
@@ -232,7 +237,14 @@ class MagnetSetFromFilaments(MagnetSet):
         Returns:
             (list of object): sorted list of Filament class objects.
         """
-        return sorted(self.filaments, key=lambda x: x.com_toroidal_angle)
+        # Compute center-of-mass toroidal angles of all filaments at once
+        coms = np.array([filament.com for filament in self.filaments])
+        com_toroidal_angles = np.arctan2(coms[:, 1], coms[:, 0])
+
+        # Use stable sort to preserve order of filaments with equal angles
+        order = np.argsort(com_toroidal_angles, kind="stable")
+
+        return [self.filaments[i] for i in order]
 
     def _filter_filaments(self, tol=0):
         """Filters list of Filament objects such that only those within the
@@ -245,14 +257,32 @@ class MagnetSetFromFilaments(MagnetSet):
         lower_bound = 2 * np.pi - tol
         upper_bound = self._toroidal_extent + tol
 
+        # Compute toroidal angle of all filament points at once, ensuring
+        # angles are positive
+        coords = np.concatenate(
+            [filament.coords for filament in self.filaments]
+        )
+        toroidal_angles = np.arctan2(coords[:, 1], coords[:, 0])
+        toroidal_angles = (toroidal_angles + 2 * np.pi) % (2 * np.pi)
+
+        # Compute bounds of toroidal extent of each filament by reducing over
+        # the segment of points belonging to it
+        start_indices = np.cumsum(
+            [0] + [len(filament.coords) for filament in self.filaments[:-1]]
+        )
+        min_tor_angs = np.minimum.reduceat(toroidal_angles, start_indices)
+        max_tor_angs = np.maximum.reduceat(toroidal_angles, start_indices)
+
         # Create filter determining whether each coil lies within model's
         # toroidal extent
-        filtered_filaments = [
+        in_toroidal_extent = _overlaps_toroidal_extent(
+            min_tor_angs, max_tor_angs, lower_bound, upper_bound
+        )
+        self.filaments = [
             filament
-            for filament in self.filaments
-            if filament.in_toroidal_extent(lower_bound, upper_bound)
+            for filament, in_extent in zip(self.filaments, in_toroidal_extent)
+            if in_extent
         ]
-        self.filaments = filtered_filaments
 
         # Sort coils by center-of-mass toroidal angle and overwrite stored list
         self.filaments = self.sort_filaments_toroidally()
@@ -273,19 +303,15 @@ class MagnetSetFromFilaments(MagnetSet):
         """Computes average and maximum radial distance of filament points.
         (Internal function not intended to be called externally)
         """
-        radii_count = 0
-        self.average_radial_distance = 0
-        self.max_radial_distance = -1
-
-        for filament in self.filaments:
-            radii = np.linalg.norm(filament.coords[:-1, :2], axis=1)
-            radii_count += len(radii)
-            self.average_radial_distance += np.sum(radii)
-            self.max_radial_distance = max(
-                self.max_radial_distance, np.max(radii)
-            )
+        # Gather the x-y coordinates of all filaments, excluding repeated
+        # final points, into a single array
+        xy_coords = np.concatenate(
+            [filament.coords[:-1, :2] for filament in self.filaments]
+        )
+        radii = np.hypot(xy_coords[:, 0], xy_coords[:, 1])
 
-        self.average_radial_distance /= radii_count
+        self.average_radial_distance = np.mean(radii)
+        self.max_radial_distance = np.max(radii)
 
     def _cut_magnets(self):
         """Cuts the magnets at the planes defining the toriodal extent.
@@ -422,16 +448,22 @@ class Filament(object):
     def coords(self, data):
         self._coords = data
 
-        tangents = np.subtract(
-            np.append(data[1:], [data[1]], axis=0),
-            np.append([data[-2]], data[0:-1], axis=0),
-        )
-        self.tangents = (
-            tangents / np.linalg.norm(tangents, axis=1)[:, np.newaxis]
-        )
+        # Compute central differences about each point of the closed loop,
+        # excluding the repeated final point, then close the loop once again
+        loop = data[:-1]
+        tangents = np.roll(loop, -1, axis=0) - np.roll(loop, 1, axis=0)
+        tangents = tangents / np.linalg.norm(tangents, axis=1, keepdims=True)
+        self.tangents = np.concatenate([tangents, tangents[:1]])
 
         self.com = np.average(data[:-1], axis=0)
-        self.com_toroidal_angle = np.arctan2(self.com[1], self.com[0])
+        # Toroidal angle of center of mass is computed on demand
+        self._com_toroidal_angle = None
+
+    @property
+    def com_toroidal_angle(self):
+        if self._com_toroidal_angle is None:
+            self._com_toroidal_angle = np.arctan2(self.com[1], self.com[0])
+        return self._com_toroidal_angle
 
     def get_ob_mp_index(self):
         """Finds the index of the outboard midplane coordinate on a coil
@@ -440,14 +472,16 @@ class Filament(object):
         Returns:
             outboard_index (int): index of the outboard midplane point.
         """
-        # Compute radial distance of coordinates from z-axis
-        radii = np.linalg.norm(self.coords[:, :2], axis=1)
         # Determine whether adjacent points cross the midplane (if so, they will
-        # have opposite signs)
-        shifted_coords = np.append(self.coords[1:], [self.coords[1]], axis=0)
-        midplane_flags = -np.sign(self.coords[:, 2] * shifted_coords[:, 2])
+        # have opposite signs). The repeated final point of the closed loop is
+        # excluded, since it is identical to the first
+        loop = self.coords[:-1]
+        z = loop[:, 2]
+        midplane_flags = -np.sign(z * np.roll(z, -1))
+        # Compute radial distance of coordinates from z-axis
+        radii = np.hypot(loop[:, 0], loop[:, 1])
         # Find index of outboard midplane point
-        outboard_index = np.argmax(midplane_flags * radii)
+        outboard_index = int(np.argmax(midplane_flags * radii))
 
         return outboard_index
 
@@ -492,12 +526,11 @@ class Filament(object):
         max_tor_ang = np.max(toroidal_angles)
 
         # Determine if filament toroidal extent overlaps with that of model
-        if (min_tor_ang >= lower_bound or min_tor_ang <= upper_bound) or (
-            max_tor_ang >= lower_bound or max_tor_ang <= upper_bound
-        ):
-            in_toroidal_extent = True
-        else:
-            in_toroidal_extent = False
+        in_toroidal_extent = bool(
+            _overlaps_toroidal_extent(
+                min_tor_ang, max_tor_ang, lower_bound, upper_bound
+            )
+        )
 
         return in_toroidal_extent
 
@@ -524,55 +557,62 @@ class MagnetCoil(object):
         self.width = width
         self.thickness = thickness
 
+        # Sample filament coordinates and tangents by modifier once, so that
+        # coil construction does not need to re-slice them
+        self._sampled_coords = downsample_loop(self.coords, sample_mod)
+        self._sampled_tangents = downsample_loop(self.tangents, sample_mod)
+
     def create_magnet(self):
         """Creates a single magnet coil CAD solid in CadQuery.
 
         Returns:
             coil (object): cq.Solid object representing a single magnet coil.
         """
-        # Sample filament coordinates and tangents by modifier
-        coords = self.coords[0 : -1 : self.sample_mod]
-        coords = np.append(coords, [self.coords[0]], axis=0)
-        tangents = self.tangents[0 : -1 : self.sample_mod]
-        tangents = np.append(tangents, [self.tangents[0]], axis=0)
+        coords = self._sampled_coords
+        tangents = self._sampled_tangents
 
-        tangent_vectors = [cq.Vector(tuple(tangent)) for tangent in tangents]
+        # Convert arrays to nested lists once so that CadQuery vectors are
+        # constructed directly from Python floats
+        tangent_vectors = [
+            cq.Vector(*tangent) for tangent in tangents.tolist()
+        ]
 
         # Define coil filament path normals such that they face the filament
         # center of mass
         # Compute "outward" direction as difference between filament positions
-        # and filament center of mass
+        # and filament center of mass. Arrays created here are owned by this
+        # call, so they are normalized in place to avoid extra temporaries
         outward_dirs = coords - self.center_of_mass
-        outward_dirs = (
-            outward_dirs / np.linalg.norm(outward_dirs, axis=1)[:, np.newaxis]
-        )
+        outward_dirs /= np.linalg.norm(outward_dirs, axis=1, keepdims=True)
 
         # Project outward directions onto desired coil cross-section (CS) plane
         # at each filament position to define filament path normals
-        parallel_parts = np.diagonal(
-            np.matmul(outward_dirs, tangents.transpose())
-        )
+        parallel_parts = np.einsum("ij,ij->i", outward_dirs, tangents)
 
         normals = outward_dirs - parallel_parts[:, np.newaxis] * tangents
-        normals = normals / np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
 
         # Compute binormals projected onto CS plane at each position
         binormals = np.cross(tangents, normals)
 
         # Compute coordinates of edges of rectangular coils
-        edge_offsets = np.array([[-1, -1], [-1, 1], [1, 1], [1, -1]])
-
-        coil_edge_coords = []
-        for edge_offset in edge_offsets:
-            coil_edge = (
-                coords
-                + edge_offset[0] * binormals * (self.width / 2)
-                + edge_offset[1] * normals * (self.thickness / 2)
-            )
+        edge_offsets = np.array([[-1, -1], [-1, 1], [1, 1], [1, -1]]) * [
+            self.width / 2,
+            self.thickness / 2,
+        ]
 
-            coil_edge_coords.append(
-                [cq.Vector(tuple(pos)) for pos in coil_edge]
-            )
+        # Broadcast offsets across all filament positions for each of the four
+        # edges at once, resulting in an array of shape (4, N, 3)
+        edge_positions = (
+            coords[np.newaxis, :, :]
+            + edge_offsets[:, 0, np.newaxis, np.newaxis] * binormals
+            + edge_offsets[:, 1, np.newaxis, np.newaxis] * normals
+        )
+
+        coil_edge_coords = [
+            [cq.Vector(*pos) for pos in coil_edge]
+            for coil_edge in edge_positions.tolist()
+        ]
 
         # Append first edge once again
         coil_edge_coords.append(coil_edge_coords[0])
@@ -591,6 +631,34 @@ class MagnetCoil(object):
         self.solid = cq.Solid.makeSolid(shell)
 
 
+def _overlaps_toroidal_extent(
+    min_tor_ang, max_tor_ang, lower_bound, upper_bound
+):
+    """Determines whether toroidal angular extents of filaments overlap with
+    that of the model. Since the model's extent wraps through 0, a filament
+    overlaps it if its minimum angle lies below the upper bound or its maximum
+    angle lies above the lower bound.
+    (Internal function not intended to be called externally)
+
+    Arguments:
+        min_tor_ang (float or array of float): minimum toroidal angle of each
+            filament on range [0, 2*pi] [rad].
+        max_tor_ang (float or array of float): maximum toroidal angle of each
+            filament on range [0, 2*pi] [rad].
+        lower_bound (float): lower bound of toroidal extent [rad].
+        upper_bound (float): upper bound of toroidal extent [rad].
+
+    Returns:
+        overlaps (bool or array of bool): flag to indicate whether each
+            filament lies within toroidal bounds.
+    """
+    overlaps = np.logical_or(
+        min_tor_ang <= upper_bound, max_tor_ang >= lower_bound
+    )
+
+    return overlaps
+
+
 def parse_args():
     """Parser for running as a script"""
     parser = argparse.ArgumentParser(prog="magnet_coils")
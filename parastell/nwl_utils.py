@@ -18,15 +18,10 @@ def extract_ss(ss_file):
         ss_file (str): path to source strength input file.
 
     Returns:
-        strengths (list): list of source strengths for each tetrahedron (1/s).
+        strengths (np.array): source strengths for each tetrahedron (1/s).
             Returned only if source mesh is generated.
     """
-    strengths = []
-
-    file_obj = open(ss_file, "r")
-    data = file_obj.readlines()
-    for line in data:
-        strengths.append(float(line))
+    strengths = np.loadtxt(ss_file, dtype=float, ndmin=1)
 
     return strengths
 
@@ -244,26 +239,27 @@ def area_from_corners(corners):
 
     Arguments:
         corners (4x3 numpy array): list of 4 (x,y,z) points. Connecting the
-            points in the order given should result in a polygon
+            points in the order given should result in a polygon. Leading
+            dimensions may be added to compute many areas at once.
 
     Returns:
-        area (float): approximation of area
+        area (float or numpy array): approximation of area
     """
     # triangle 1
-    v1 = corners[3] - corners[0]
-    v2 = corners[2] - corners[0]
+    v1 = corners[..., 3, :] - corners[..., 0, :]
+    v2 = corners[..., 2, :] - corners[..., 0, :]
 
     v3 = np.cross(v1, v2)
 
-    area1 = np.sqrt(np.sum(np.square(v3))) / 2
+    area1 = np.sqrt(np.sum(np.square(v3), axis=-1)) / 2
 
     # triangle 2
-    v1 = corners[1] - corners[0]
-    v2 = corners[2] - corners[0]
+    v1 = corners[..., 1, :] - corners[..., 0, :]
+    v2 = corners[..., 2, :] - corners[..., 0, :]
 
     v3 = np.cross(v1, v2)
 
-    area2 = np.sqrt(np.sum(np.square(v3))) / 2
+    area2 = np.sqrt(np.sum(np.square(v3), axis=-1)) / 2
 
     area = area1 + area2
 
@@ -369,7 +365,7 @@ def nwl_plot(
     eV2J = 1.60218e-19
     # Compute total neutron source strength (n/s)
     strengths = extract_ss(ss_file)
-    SS = sum(strengths)
+    SS = np.sum(strengths)
     # Define joules to megajoules constant
     J2MJ = 1e-6
     # Define number of source particles
@@ -387,18 +383,17 @@ def nwl_plot(
             bin_arr[phi_bin, theta_bin, :] = [x, y, z]
 
     # construct area array
-    area_array = np.zeros((num_phi, num_theta))
-
-    for phi_index in range(num_phi):
-        for theta_index in range(num_theta):
-            # each bin has 4 (x,y,z) corners
-            corner1 = bin_arr[phi_index, theta_index]
-            corner2 = bin_arr[phi_index, theta_index + 1]
-            corner3 = bin_arr[phi_index + 1, theta_index + 1]
-            corner4 = bin_arr[phi_index + 1, theta_index]
-            corners = np.array([corner1, corner2, corner3, corner4])
-            area = area_from_corners(corners)
-            area_array[phi_index, theta_index] = area
+    # each bin has 4 (x,y,z) corners, gathered for all bins at once
+    corners = np.stack(
+        [
+            bin_arr[:-1, :-1],
+            bin_arr[:-1, 1:],
+            bin_arr[1:, 1:],
+            bin_arr[1:, :-1],
+        ],
+        axis=-2,
+    )
+    area_array = area_from_corners(corners)
 
     nwl_mat = nwl_mat / area_array
     plot(nwl_mat, phi_pts, theta_pts, num_levels)
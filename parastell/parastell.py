@@ -315,6 +315,9 @@ class Stellarator(object):
             reaction_rate (function): function that takes the values returned by
                 plasma_conditions() and returns a reaction rate in
                 reactions/cm3/s
+            dtype (data-type): floating point precision of the tetrahedron
+                volume and source strength computations (defaults to
+                np.float64). Must be a floating point type.
         """
         self.source_mesh = sm.SourceMesh(
             self._vmec_obj,
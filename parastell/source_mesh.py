@@ -10,6 +10,100 @@ from .utils import read_yaml_config, filter_kwargs, m2cm, m3tocm3
 
 export_allowed_kwargs = ["filename"]
 
+# Define weights of five-node Gaussian quadrature over a tetrahedron, collapsed
+# with the barycentric coordinates of the integration points into a single
+# weight per tetrahedron vertex
+_QUAD_W = np.array([-0.8, 0.45, 0.45, 0.45, 0.45]) @ np.array(
+    [
+        [0.25, 0.25, 0.25, 0.25],
+        [0.5, 1 / 6, 1 / 6, 1 / 6],
+        [1 / 6, 0.5, 1 / 6, 1 / 6],
+        [1 / 6, 1 / 6, 0.5, 1 / 6],
+        [1 / 6, 1 / 6, 1 / 6, 0.5],
+    ]
+)
+
+# Define relative offsets of hexahedron vertices in a 3-D
+# [CFS, poloidal, toroidal] index space
+_HEX_VERTEX_STENCIL = np.array(
+    [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ],
+    dtype=np.int32,
+)
+
+# Define relative offsets of wedge vertices in a 3-D index space
+_WEDGE_VERTEX_STENCIL = np.array(
+    [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+    ],
+    dtype=np.int32,
+)
+# Only wedge vertices off of the magnetic axis are offset by the poloidal index
+# of the wedge
+_WEDGE_POLOIDAL_MASK = np.stack(
+    [
+        np.ones(len(_WEDGE_VERTEX_STENCIL), dtype=np.int32),
+        _WEDGE_VERTEX_STENCIL[:, 0],
+        np.ones(len(_WEDGE_VERTEX_STENCIL), dtype=np.int32),
+    ],
+    axis=-1,
+)
+
+# Define MOAB canonical ordering of hexahedron and wedge vertex indices, as
+# positions within the parent element's vertices
+# Ordering follows right hand rule such that the fingers curl around one side
+# of the tetrahedron and the thumb points to the remaining vertex. The vertices
+# are ordered such that those on the side are first, ordered clockwise relative
+# to the thumb, followed by the remaining vertex at the end of the thumb.
+# See Moreno, Bader, Wilson 2024 for hexahedron and wedge splitting
+_HEX_ORDERING_SCHEMES = np.array(
+    [
+        [
+            [0, 3, 1, 4],
+            [1, 3, 2, 6],
+            [1, 4, 6, 5],
+            [3, 6, 4, 7],
+            [1, 3, 6, 4],
+        ],
+        [
+            [0, 2, 1, 5],
+            [0, 3, 2, 7],
+            [0, 7, 5, 4],
+            [7, 2, 5, 6],
+            [0, 2, 5, 7],
+        ],
+    ],
+    dtype=np.int32,
+)
+_WEDGE_ORDERING_SCHEMES = np.array(
+    [
+        [
+            [0, 2, 1, 3],
+            [1, 3, 5, 4],
+            [1, 3, 2, 5],
+        ],
+        [
+            [0, 2, 1, 3],
+            [3, 2, 4, 5],
+            [3, 2, 1, 4],
+        ],
+    ],
+    dtype=np.int32,
+)
+
 
 def default_reaction_rate(n_i, T_i):
     """Default reaction rate formula for DT fusion assumes an equal mixture of
@@ -105,6 +199,11 @@ class SourceMesh(object):
             default_plasma_conditions()
         reaction_rate (function): function that takes the values returned by
             plasma_conditions() and returns a reaction rate in reactions/cm3/s
+        dtype (data-type): floating point precision of the tetrahedron
+            volume and source strength computations, e.g. 'float32' to halve
+            memory traffic on large meshes (defaults to np.float64). Vertex
+            coordinates, MOAB vertices and MOAB tags are always kept in double
+            precision.
     """
 
     def __init__(
@@ -121,11 +220,13 @@ class SourceMesh(object):
         self.scale = m2cm
         self.plasma_conditions = default_plasma_conditions
         self.reaction_rate = default_reaction_rate
+        self.dtype = np.float64
 
         for name in kwargs.keys() & (
             "scale",
             "plasma_conditions",
             "reaction_rate",
+            "dtype",
         ):
             self.__setattr__(name, kwargs[name])
 
@@ -134,6 +235,23 @@ class SourceMesh(object):
 
         self._create_mbc()
 
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        dtype = np.dtype(value)
+        if not np.issubdtype(dtype, np.floating):
+            e = AttributeError(
+                "Source mesh precision must be a floating point type; got "
+                + str(dtype)
+                + "."
+            )
+            self._logger.error(e.args[0])
+            raise e
+        self._dtype = dtype
+
     @property
     def num_poloidal_pts(self):
         return self._num_poloidal_pts
@@ -249,263 +367,266 @@ class SourceMesh(object):
         self.verts_per_ring = poloidal_grid_pts.shape[0]
         # add one vertex per plane for magenetic axis
         self.verts_per_plane = cfs_grid_pts.shape[0] * self.verts_per_ring + 1
+        # Number of distinct toroidal planes, about which toroidal indices wrap
+        # if the mesh is closed toroidally
+        self._toroidal_wrap = toroidal_grid_pts.shape[0]
+
+        # Define flux coordinates of vertices in a single toroidal plane,
+        # beginning with the vertex on the magnetic axis, followed by each
+        # closed flux surface with poloidal angle varying fastest
+        plane_cfs = np.concatenate(
+            [[0.0], np.repeat(cfs_grid_pts, self.verts_per_ring)]
+        )
+        plane_poloidal = np.concatenate(
+            [[0.0], np.tile(poloidal_grid_pts, cfs_grid_pts.shape[0])]
+        )
 
+        # Stream Cartesian coordinates of all vertices directly into a single
+        # preallocated buffer, then scale in place
         num_verts = toroidal_grid_pts.shape[0] * self.verts_per_plane
-        self.coords = np.zeros((num_verts, 3))
-        self.coords_cfs = np.zeros(num_verts)
-
-        # Initialize vertex index
-        vert_idx = 0
-
-        for toroidal_ang in toroidal_grid_pts:
-            # vertex coordinates on magnetic axis
-            self.coords[vert_idx, :] = (
-                np.array(self.vmec_obj.vmec2xyz(0, 0, toroidal_ang))
-                * self.scale
-            )
-            self.coords_cfs[vert_idx] = 0
-
-            vert_idx += 1
-
-            # vertex coordinate away from magnetic axis
-            for cfs in cfs_grid_pts:
-                for poloidal_ang in poloidal_grid_pts:
-                    self.coords[vert_idx, :] = (
-                        np.array(
-                            self.vmec_obj.vmec2xyz(
-                                cfs, poloidal_ang, toroidal_ang
-                            )
-                        )
-                        * self.scale
-                    )
-                    self.coords_cfs[vert_idx] = cfs
-
-                    vert_idx += 1
+        self.coords = np.fromiter(
+            (
+                coord
+                for toroidal_ang in toroidal_grid_pts
+                for cfs, poloidal_ang in zip(plane_cfs, plane_poloidal)
+                for coord in self.vmec_obj.vmec2xyz(
+                    cfs, poloidal_ang, toroidal_ang
+                )
+            ),
+            dtype=float,
+            count=3 * num_verts,
+        ).reshape(num_verts, 3)
+        self.coords *= self.scale
+        self.coords_cfs = np.tile(plane_cfs, toroidal_grid_pts.shape[0])
+
+        # Compute source strength once for each distinct CFS value, to be
+        # shared by all vertices on that surface and all tetrahedra containing
+        # them. Plasma conditions and reaction rate are evaluated with scalar
+        # CFS values, so user-supplied functions need not support arrays
+        cfs_values, cfs_inverse = np.unique(
+            self.coords_cfs, return_inverse=True
+        )
+        cfs_strengths = np.array(
+            [
+                self.reaction_rate(*self.plasma_conditions(cfs))
+                for cfs in cfs_values
+            ],
+            dtype=float,
+        )
+        self.vertex_strengths = cfs_strengths[cfs_inverse].astype(
+            self._dtype, copy=False
+        )
 
         self.verts = self.mbc.create_vertices(self.coords)
 
-    def _source_strength(self, tet_ids):
-        """Computes neutron source strength for a tetrahedron using five-node
-        Gaussian quadrature.
+    def _source_strengths(self, tet_ids):
+        """Computes neutron source strengths for a set of tetrahedra using
+        five-node Gaussian quadrature.
         (Internal function not intended to be called externally)
 
         Arguments:
-            ids (list of int): tetrahedron vertex indices.
+            tet_ids (2-D array of int): vertex indices of each tetrahedron,
+                with shape (number of tetrahedra, 4).
 
         Returns:
-            ss (float): integrated source strength for tetrahedron.
+            ss (1-D array of float): integrated source strength for each
+                tetrahedron.
+            tet_vols (1-D array of float): signed volume of each tetrahedron.
         """
-        # Initialize list of vertex coordinates for each tetrahedron vertex
-        tet_coords = [self.coords[id] for id in tet_ids]
-
-        # Initialize list of source strengths for each tetrahedron vertex
-        vertex_strengths = [
-            self.reaction_rate(*self.plasma_conditions(self.coords_cfs[id]))
-            for id in tet_ids
-        ]
-
-        # Define barycentric coordinates for integration points
-        bary_coords = np.array(
-            [
-                [0.25, 0.25, 0.25, 0.25],
-                [0.5, 1 / 6, 1 / 6, 1 / 6],
-                [1 / 6, 0.5, 1 / 6, 1 / 6],
-                [1 / 6, 1 / 6, 0.5, 1 / 6],
-                [1 / 6, 1 / 6, 1 / 6, 0.5],
-            ]
+        # Gather vertex coordinates for each tetrahedron vertex
+        tet_coords = self.coords[tet_ids]
+
+        # Gather precomputed source strengths for each tetrahedron vertex
+        vertex_strengths = self.vertex_strengths[tet_ids]
+
+        # Compute edge vectors between tetrahedron vertices. Since the
+        # determinant is invariant under transposition, edge vectors are kept
+        # as matrix rows. Differences are taken in double precision, before
+        # any conversion to the working precision, such that small elements
+        # far from the origin do not lose their significant digits
+        edge_vectors = (tet_coords[:, :3] - tet_coords[:, 3:]).astype(
+            self._dtype, copy=False
         )
 
-        # Define weights for integration points
-        int_w = np.array([-0.8, 0.45, 0.45, 0.45, 0.45])
-
-        # Interpolate source strength at integration points
-        ss_int_pts = np.dot(bary_coords, vertex_strengths)
-
-        # Compute edge vectors between tetrahedron vertices
-        edge_vectors = np.subtract(tet_coords[:3], tet_coords[3]).T
+        # Compute determinants of edge vector matrices by cofactor expansion,
+        # which is much cheaper than a batched LU factorization for 3 x 3
+        # matrices
+        e = edge_vectors
+        det = (
+            e[:, 0, 0] * (e[:, 1, 1] * e[:, 2, 2] - e[:, 1, 2] * e[:, 2, 1])
+            - e[:, 0, 1] * (e[:, 1, 0] * e[:, 2, 2] - e[:, 1, 2] * e[:, 2, 0])
+            + e[:, 0, 2] * (e[:, 1, 0] * e[:, 2, 1] - e[:, 1, 1] * e[:, 2, 0])
+        )
 
-        tet_vol = -np.linalg.det(edge_vectors) / 6
+        tet_vols = -det / 6
 
-        ss = np.abs(tet_vol) * np.dot(int_w, ss_int_pts)
+        ss = np.abs(tet_vols) * (
+            vertex_strengths @ _QUAD_W.astype(self._dtype, copy=False)
+        )
 
-        return ss, tet_vol
+        return ss, tet_vols
 
-    def _create_tet(self, tet_ids):
-        """Creates tetrahedron and adds to pyMOAB core.
+    def _create_tets(self, tet_ids, strengths, volumes):
+        """Creates tetrahedra in bulk, adds them to pyMOAB core and tags them
+        with data.
         (Internal function not intended to be called externally)
 
         Arguments:
-            tet_ids (list of int): tetrahedron vertex indices.
+            tet_ids (2-D array of int): vertex indices of each tetrahedron,
+                with shape (number of tetrahedra, 4).
+            strengths (1-D array of float): integrated source strength for each
+                tetrahedron.
+            volumes (1-D array of float): volume of each tetrahedron.
         """
-        tet_verts = [self.verts[int(id)] for id in tet_ids]
-        tet = self.mbc.create_element(types.MBTET, tet_verts)
-        self.mbc.add_entity(self.mesh_set, tet)
-
-        # Compute source strength for tetrahedron
-        ss, vol = self._source_strength(tet_ids)
-        self.strengths.append(ss)
-        self.volumes.append(vol)
-
-        # Tag tetrahedra with data
-        self.mbc.tag_set_data(self.source_strength_tag, tet, [ss])
-        self.mbc.tag_set_data(self.volume_tag, tet, [vol])
+        tet_verts = self._vert_handles[tet_ids]
+        tets = self.mbc.create_elements(types.MBTET, tet_verts)
+        self.mbc.add_entities(self.mesh_set, tets)
+
+        # Tag the range of tetrahedra with data in contiguous buffers matching
+        # the double precision tag type
+        self.mbc.tag_set_data(
+            self.source_strength_tag,
+            tets,
+            np.ascontiguousarray(strengths, dtype=np.float64),
+        )
+        self.mbc.tag_set_data(
+            self.volume_tag,
+            tets,
+            np.ascontiguousarray(volumes, dtype=np.float64),
+        )
 
     def _get_vertex_id(self, vertex_idx):
-        """Computes vertex index in row-major order as stored by MOAB from
+        """Computes vertex indices in row-major order as stored by MOAB from
         three-dimensional n x 3 matrix indices.
         (Internal function not intended to be called externally)
 
         Arguments:
-            vert_idx (list of int): list of vertex
+            vertex_idx (array of int): vertex indices
                 [flux surface index, poloidal angle index, toroidal angle index]
+                along the last axis.
 
         Returns:
-            id (int): vertex index in row-major order as stored by MOAB
+            id (array of int): vertex indices in row-major order as stored by
+                MOAB, with the shape of vertex_idx excluding its last axis.
         """
-        cfs_idx, poloidal_idx, toroidal_idx = vertex_idx
-
-        ma_offset = toroidal_idx * self.verts_per_plane
+        vertex_idx = np.asarray(vertex_idx)
+        cfs_idx = vertex_idx[..., 0]
+        poloidal_idx = vertex_idx[..., 1]
+        toroidal_idx = vertex_idx[..., 2]
 
         # Wrap around if final plane and it is 2*pi
-        if (
-            self._toroidal_extent == 2 * np.pi
-            and toroidal_idx == self._num_toroidal_pts - 1
-        ):
-            ma_offset = 0
+        ma_offset = (toroidal_idx % self._toroidal_wrap) * self.verts_per_plane
 
         # Compute index offset from closed flux surface, taking single vertex
         # at magnetic axis into account
-        if cfs_idx == 0:
-            cfs_offset = cfs_idx
-        else:
-            cfs_offset = (cfs_idx - 1) * self.verts_per_ring + 1
+        cfs_offset = np.where(
+            cfs_idx == 0, 0, (cfs_idx - 1) * self.verts_per_ring + 1
+        )
 
-        poloidal_offset = poloidal_idx
         # Wrap around if poloidal angle is 2*pi
-        if poloidal_idx == self._num_poloidal_pts - 1:
-            poloidal_offset = 0
+        poloidal_offset = poloidal_idx % self.verts_per_ring
 
         id = ma_offset + cfs_offset + poloidal_offset
 
         return id
 
     def _create_tets_from_hex(self, cfs_idx, poloidal_idx, toroidal_idx):
-        """Creates five tetrahedra from defined hexahedron.
+        """Defines vertex indices of five tetrahedra from each of a set of
+        hexahedra.
         (Internal function not intended to be called externally)
 
         Arguments:
-            cfs_idx (int): index defining location along CFS axis.
-            poloidal_idx (int): index defining location along poloidal angle axis.
-            toroidal_idx (int): index defining location along toroidal angle axis.
-        """
-        # relative offsets of vertices in a 3-D index space
-        hex_vertex_stencil = np.array(
-            [
-                [0, 0, 0],
-                [1, 0, 0],
-                [1, 1, 0],
-                [0, 1, 0],
-                [0, 0, 1],
-                [1, 0, 1],
-                [1, 1, 1],
-                [0, 1, 1],
-            ]
-        )
+            cfs_idx (array of int): indices defining location along CFS axis.
+            poloidal_idx (array of int): indices defining location along
+                poloidal angle axis.
+            toroidal_idx (array of int): indices defining location along
+                toroidal angle axis.
 
-        # Ids of hex vertices applying offset stencil to current point
+        Returns:
+            tet_ids (array of int): vertex indices of each tetrahedron, with
+                the broadcast shape of the input indices followed by (5, 4).
+        """
+        # Ids of hex vertices applying offset stencil to each point, resulting
+        # in an array with trailing dimensions (8, 3)
         hex_idx_data = (
-            np.array([cfs_idx, poloidal_idx, toroidal_idx])
-            + hex_vertex_stencil
+            np.stack(
+                np.broadcast_arrays(cfs_idx, poloidal_idx, toroidal_idx),
+                axis=-1,
+            )[..., np.newaxis, :]
+            + _HEX_VERTEX_STENCIL
         )
 
-        idx_list = [
-            self._get_vertex_id(vertex_idx) for vertex_idx in hex_idx_data
-        ]
-
-        # Define MOAB canonical ordering of hexahedron vertex indices
-        # Ordering follows right hand rule such that the fingers curl around
-        # one side of the tetrahedron and the thumb points to the remaining
-        # vertex. The vertices are ordered such that those on the side are
-        # first, ordered clockwise relative to the thumb, followed by the
-        # remaining vertex at the end of the thumb.
-        # See Moreno, Bader, Wilson 2024 for hexahedron splitting
-        canonical_ordering_schemes = [
-            [
-                [idx_list[0], idx_list[3], idx_list[1], idx_list[4]],
-                [idx_list[1], idx_list[3], idx_list[2], idx_list[6]],
-                [idx_list[1], idx_list[4], idx_list[6], idx_list[5]],
-                [idx_list[3], idx_list[6], idx_list[4], idx_list[7]],
-                [idx_list[1], idx_list[3], idx_list[6], idx_list[4]],
-            ],
-            [
-                [idx_list[0], idx_list[2], idx_list[1], idx_list[5]],
-                [idx_list[0], idx_list[3], idx_list[2], idx_list[7]],
-                [idx_list[0], idx_list[7], idx_list[5], idx_list[4]],
-                [idx_list[7], idx_list[2], idx_list[5], idx_list[6]],
-                [idx_list[0], idx_list[2], idx_list[5], idx_list[7]],
-            ],
-        ]
+        idx_list = self._get_vertex_id(hex_idx_data)
 
         # Alternate canonical ordering schemes defining hexahedron splitting to
         # avoid gaps and overlaps between non-planar hexahedron faces
         scheme_idx = (cfs_idx + poloidal_idx + toroidal_idx) % 2
 
-        for vertex_ids in canonical_ordering_schemes[scheme_idx]:
-            self._create_tet(vertex_ids)
+        return self._select_tet_ids(
+            idx_list, _HEX_ORDERING_SCHEMES[scheme_idx]
+        )
 
     def _create_tets_from_wedge(self, poloidal_idx, toroidal_idx):
-        """Creates three tetrahedra from defined wedge.
+        """Defines vertex indices of three tetrahedra from each of a set of
+        wedges about the magnetic axis.
         (Internal function not intended to be called externally)
 
         Arguments:
-            poloidal_idx (int): index defining location along poloidal angle axis.
-            toroidal_idx (int): index defining location along toroidal angle axis.
+            poloidal_idx (array of int): indices defining location along
+                poloidal angle axis.
+            toroidal_idx (array of int): indices defining location along
+                toroidal angle axis.
+
+        Returns:
+            tet_ids (array of int): vertex indices of each tetrahedron, with
+                the broadcast shape of the input indices followed by (3, 4).
         """
-        # relative offsets of wedge vertices in a 3-D index space
-        wedge_vertex_stencil = np.array(
-            [
-                [0, 0, 0],
-                [1, poloidal_idx, 0],
-                [1, poloidal_idx + 1, 0],
-                [0, 0, 1],
-                [1, poloidal_idx, 1],
-                [1, poloidal_idx + 1, 1],
-            ]
+        # Ids of wedge vertices applying offset stencil to each point,
+        # resulting in an array with trailing dimensions (6, 3). Only vertices
+        # off of the magnetic axis are offset by the poloidal index
+        wedge_idx_data = (
+            np.stack(
+                np.broadcast_arrays(0, poloidal_idx, toroidal_idx), axis=-1
+            )[..., np.newaxis, :]
+            * _WEDGE_POLOIDAL_MASK
+            + _WEDGE_VERTEX_STENCIL
         )
 
-        # Ids of wedge vertices applying offset stencil to current point
-        wedge_idx_data = np.array([0, 0, toroidal_idx]) + wedge_vertex_stencil
-
-        idx_list = [
-            self._get_vertex_id(vertex_idx) for vertex_idx in wedge_idx_data
-        ]
-
-        # Define MOAB canonical ordering of wedge vertex indices
-        # Ordering follows right hand rule such that the fingers curl around
-        # one side of the tetrahedron and the thumb points to the remaining
-        # vertex. The vertices are ordered such that those on the side are
-        # first, ordered clockwise relative to the thumb, followed by the
-        # remaining vertex at the end of the thumb.
-        # See Moreno, Bader, Wilson 2024 for wedge splitting
-        canonical_ordering_schemes = [
-            [
-                [idx_list[0], idx_list[2], idx_list[1], idx_list[3]],
-                [idx_list[1], idx_list[3], idx_list[5], idx_list[4]],
-                [idx_list[1], idx_list[3], idx_list[2], idx_list[5]],
-            ],
-            [
-                [idx_list[0], idx_list[2], idx_list[1], idx_list[3]],
-                [idx_list[3], idx_list[2], idx_list[4], idx_list[5]],
-                [idx_list[3], idx_list[2], idx_list[1], idx_list[4]],
-            ],
-        ]
+        idx_list = self._get_vertex_id(wedge_idx_data)
 
         # Alternate canonical ordering schemes defining wedge splitting to
         # avoid gaps and overlaps between non-planar wedge faces
         scheme_idx = (poloidal_idx + toroidal_idx) % 2
 
-        for vertex_ids in canonical_ordering_schemes[scheme_idx]:
-            self._create_tet(vertex_ids)
+        return self._select_tet_ids(
+            idx_list, _WEDGE_ORDERING_SCHEMES[scheme_idx]
+        )
+
+    def _select_tet_ids(self, idx_list, orderings):
+        """Selects vertex indices of tetrahedra from those of their parent
+        elements according to per-element canonical orderings.
+        (Internal function not intended to be called externally)
+
+        Arguments:
+            idx_list (array of int): vertex indices of each element, with
+                trailing dimension equal to the number of element vertices.
+            orderings (array of int): positions of each tetrahedron's vertices
+                within its parent element, with trailing dimensions
+                (tetrahedra per element, 4).
+
+        Returns:
+            tet_ids (array of int): vertex indices of each tetrahedron, with
+                the shape of orderings.
+        """
+        tet_ids = np.take_along_axis(
+            idx_list,
+            orderings.reshape(
+                *orderings.shape[:-2], np.prod(orderings.shape[-2:])
+            ),
+            axis=-1,
+        )
+
+        return tet_ids.reshape(orderings.shape)
 
     def create_mesh(self):
         """Creates volumetric source mesh in real space."""
@@ -514,17 +635,83 @@ class SourceMesh(object):
         self.mesh_set = self.mbc.create_meshset()
         self.mbc.add_entity(self.mesh_set, self.verts)
 
-        for toroidal_idx in range(self._num_toroidal_pts - 1):
-            # Create tetrahedra for wedges at center of plasma
-            for poloidal_idx in range(self._num_poloidal_pts - 1):
-                self._create_tets_from_wedge(poloidal_idx, toroidal_idx)
+        # Store vertex handles as an array such that they can be gathered for
+        # all tetrahedra at once
+        self._vert_handles = np.fromiter(
+            self.verts, dtype=np.uint64, count=len(self.verts)
+        )
+
+        num_toroidal_intervals = self._num_toroidal_pts - 1
+        num_poloidal_intervals = self._num_poloidal_pts - 1
+
+        # Compute number of tetrahedra in each toroidal slab of the mesh, with
+        # three per wedge and five per hexahedron
+        num_wedge_tets = 3 * num_poloidal_intervals
+        num_hex_tets = 5 * (self.num_cfs_pts - 2) * num_poloidal_intervals
+        tets_per_slab = num_wedge_tets + num_hex_tets
 
-            # Create tetrahedra for hexahedra beyond center of plasma
-            for cfs_idx in range(1, self.num_cfs_pts - 1):
-                for poloidal_idx in range(self._num_poloidal_pts - 1):
+        num_tets = num_toroidal_intervals * tets_per_slab
+        self.strengths = np.empty(num_tets, dtype=self._dtype)
+        self.volumes = np.empty(num_tets, dtype=self._dtype)
+
+        # Define index grids of wedges and hexahedra within a toroidal slab
+        poloidal_idx = np.arange(num_poloidal_intervals, dtype=np.int32)
+        cfs_idx, hex_poloidal_idx = np.mgrid[
+            1 : self.num_cfs_pts - 1, 0:num_poloidal_intervals
+        ]
+
+        # Define vertex indices of tetrahedra in the first two toroidal slabs,
+        # which between them use both alternating ordering schemes. Within
+        # each slab, wedge tetrahedra precede hexahedron tetrahedra
+        slab_templates = [
+            np.concatenate(
+                [
+                    # Create tetrahedra for wedges at center of plasma
+                    self._create_tets_from_wedge(
+                        poloidal_idx, toroidal_idx
+                    ).reshape(num_wedge_tets, 4),
+                    # Create tetrahedra for hexahedra beyond center of plasma
                     self._create_tets_from_hex(
-                        cfs_idx, poloidal_idx, toroidal_idx
-                    )
+                        cfs_idx, hex_poloidal_idx, toroidal_idx
+                    ).reshape(num_hex_tets, 4),
+                ],
+                dtype=np.int32,
+            )
+            for toroidal_idx in range(min(2, num_toroidal_intervals))
+        ]
+
+        # Vertex indices of any other slab are those of the template with
+        # matching scheme parity, offset by whole toroidal planes. Only the
+        # final slab of a toroidally closed mesh reaches past the last distinct
+        # plane, so only it is wrapped about the total number of vertices
+        num_verts = self._toroidal_wrap * self.verts_per_plane
+        wrapped_slab_idx = self._toroidal_wrap - 1
+
+        # Connectivity buffer reused by each toroidal slab
+        slab_tet_ids = np.empty((tets_per_slab, 4), dtype=np.int32)
+
+        # Process mesh one toroidal slab at a time to bound peak memory usage
+        for toroidal_idx in range(num_toroidal_intervals):
+            parity = toroidal_idx % 2
+            np.add(
+                slab_templates[parity],
+                (toroidal_idx - parity) * self.verts_per_plane,
+                out=slab_tet_ids,
+            )
+            if toroidal_idx == wrapped_slab_idx:
+                np.remainder(slab_tet_ids, num_verts, out=slab_tet_ids)
+
+            slab = slice(
+                toroidal_idx * tets_per_slab,
+                (toroidal_idx + 1) * tets_per_slab,
+            )
+            self.strengths[slab], self.volumes[slab] = self._source_strengths(
+                slab_tet_ids
+            )
+
+            self._create_tets(
+                slab_tet_ids, self.strengths[slab], self.volumes[slab]
+            )
 
     def export_mesh(self, filename="source_mesh", export_dir=""):
         """Use PyMOAB interface to write source mesh with source strengths
@@ -13,6 +13,12 @@ import dagmc
 m2cm = 100
 m3tocm3 = m2cm * m2cm * m2cm
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 
 def downsample_loop(list, sample_mod):
     """Downsamples a list representing a closed loop.
@@ -22,9 +28,25 @@ def downsample_loop(list, sample_mod):
         sample_mod (int): sampling modifier.
 
     Returns:
-        (iterable): downsampled closed loop
+        (iterable): downsampled closed loop. May be a view of the input loop.
     """
-    return np.append(list[:-1:sample_mod], [list[0]], axis=0)
+    list = np.asarray(list)
+
+    # When the sampling stride lands on the closing point and that point
+    # repeats the first, the strided view is already the downsampled loop
+    if (len(list) - 1) % sample_mod == 0 and np.array_equal(list[-1], list[0]):
+        return list[::sample_mod]
+
+    samples = list[:-1:sample_mod]
+
+    downsampled_loop = np.empty(
+        (len(samples) + 1,) + list.shape[1:], dtype=list.dtype
+    )
+    downsampled_loop[:-1] = samples
+    # Close loop with its first element
+    downsampled_loop[-1] = list[0]
+
+    return downsampled_loop
 
 
 def enforce_helical_symmetry(matrix):
@@ -43,31 +65,28 @@ def enforce_helical_symmetry(matrix):
     Returns:
         matrix (2-D iterable of float): helically symmetric matrix.
     """
-    num_rows, num_columns = matrix.shape
+    # Ensure matrix is contiguous such that a flattened view of it can be
+    # written to in place
+    matrix = np.ascontiguousarray(matrix)
+    num_columns = matrix.shape[1]
 
     # Ensure rows represent closed loops
     matrix[:, -1] = matrix[:, 0]
 
-    # Ensure poloidal symmetry at beginning of period
-    matrix[0] = np.concatenate(
-        [
-            # Ceil and floor ensure middle element of odd sized array is
-            # included only once
-            matrix[0, : math.ceil(num_columns / 2)],
-            np.flip(matrix[0, : math.floor(num_columns / 2)]),
-        ]
-    )
+    # Ensure poloidal symmetry at beginning of period. Ceil and floor ensure
+    # middle element of odd sized array is retained only once
+    matrix[0, math.ceil(num_columns / 2) :] = matrix[
+        0, : math.floor(num_columns / 2)
+    ][::-1]
 
     # Ensure helical symmetry toroidally and poloidally by mirroring the period
     # about both matrix axes
-    flattened_matrix = matrix.flatten()
+    flattened_matrix = matrix.ravel()
     flattened_length = len(flattened_matrix)
 
-    first_half = flattened_matrix[: math.ceil(flattened_length / 2)]
-    last_half = np.flip(flattened_matrix[: math.floor(flattened_length / 2)])
-    flattened_matrix = np.concatenate([first_half, last_half])
-
-    matrix = flattened_matrix.reshape((num_rows, num_columns))
+    flattened_matrix[math.ceil(flattened_length / 2) :] = flattened_matrix[
+        : math.floor(flattened_length / 2)
+    ][::-1]
 
     return matrix
 
@@ -89,7 +108,7 @@ def expand_list(list_to_expand, num):
     if len(list_to_expand) >= num:
         return list_to_expand
 
-    list_exp = []
+    list_to_expand = np.asarray(list_to_expand, dtype=float)
 
     init_entry = list_to_expand[0]
     final_entry = list_to_expand[-1]
@@ -97,31 +116,30 @@ def expand_list(list_to_expand, num):
 
     avg_diff = extent / (num - 1)
 
-    for entry, next_entry in zip(list_to_expand[:-1], list_to_expand[1:]):
-        # Only add entries to current block if difference between entry and
-        # next_entry is greater than desired average
-        num_new_entries = 0
-
-        if next_entry - entry > avg_diff:
-            # Goal is to create bins of approximately avg_diff width between
-            # entry and next_entry
-            num_new_entries = int(round((next_entry - entry) / avg_diff)) - 1
-
-        # Manually append first entry
-        list_exp = np.append(list_exp, entry)
-
-        # If num_new_entries == 0, don't add new entries
-        # First and last elements of new_entries are entry and next_entry,
-        # respectively
-        new_entries = np.linspace(
-            entry,
-            next_entry,
-            num=num_new_entries + 2,
-        )[1:-1]
-
-        list_exp = np.append(list_exp, new_entries)
-
-    list_exp = np.append(list_exp, final_entry)
+    entries = list_to_expand[:-1]
+    diffs = np.diff(list_to_expand)
+
+    # Only add entries to a block if difference between entry and next entry
+    # is greater than desired average. Goal is to create bins of approximately
+    # avg_diff width between entry and next entry
+    with np.errstate(divide="ignore", invalid="ignore"):
+        num_new_entries = np.where(
+            diffs > avg_diff, np.round(diffs / avg_diff) - 1, 0
+        ).astype(int)
+
+    # Each block consists of its first entry followed by its new entries,
+    # evenly spaced between entry and next entry
+    block_sizes = num_new_entries + 1
+    block_starts = np.cumsum(block_sizes) - block_sizes
+    block_idx = np.repeat(np.arange(len(entries)), block_sizes)
+    # Position of each entry within its block
+    positions = np.arange(block_sizes.sum()) - block_starts[block_idx]
+
+    list_exp = np.empty(block_sizes.sum() + 1)
+    list_exp[:-1] = (
+        positions * (diffs / block_sizes)[block_idx] + entries[block_idx]
+    )
+    list_exp[-1] = final_entry
 
     return list_exp
 
@@ -137,7 +155,7 @@ def filter_kwargs(
 
     Arguments:
         dict (dict): dictionary of arguments and corresponding values.
-        allowed_kwargs (list of str): list of allowed keyword argument names.
+        allowed_kwargs (iterable of str): allowed keyword argument names.
         all_kwargs (bool): flag to indicate whether 'allowed_kwargs' should
             represent all keys present in 'dict' (optional, defaults to False).
         fn_name (str): name of class method (optional, defaults to None). If
@@ -148,10 +166,17 @@ def filter_kwargs(
     Returns:
         kwarg_dict (dict): dictionary of keyword arguments and values.
     """
-    allowed_keys = dict.keys() & allowed_kwargs
-    extra_keys = dict.keys() - allowed_kwargs
+    # Hash-based membership avoids a linear scan of the allowed names per key
+    if not isinstance(allowed_kwargs, (set, frozenset)):
+        allowed_kwargs = frozenset(allowed_kwargs)
 
-    if all_kwargs and extra_keys:
+    kwarg_dict = {
+        name: value for name, value in dict.items() if name in allowed_kwargs
+    }
+
+    # Unsupported names can only be present if some entries were dropped
+    if all_kwargs and len(kwarg_dict) != len(dict):
+        extra_keys = dict.keys() - allowed_kwargs
         e = ValueError(
             f"{extra_keys} not supported keyword argument(s) of "
             f'"{fn_name}"'
@@ -159,31 +184,37 @@ def filter_kwargs(
         logger.error(e.args[0])
         raise e
 
-    return {name: dict[name] for name in allowed_keys}
+    return kwarg_dict
 
 
-def normalize(vec_list):
+def normalize(vec_list, out=None):
     """Normalizes a set of vectors.
 
     Arguments:
         vec_list (1 or 2D np array): single 1D vector or array of 1D vectors
             to be normalized
+        out (np array): array in which to store the result, which may be
+            'vec_list' itself to normalize in place (optional, defaults to
+            None).
     Returns:
         vec_list (np array of same shape as input): single 1D normalized vector
             or array of normalized 1D vectors
     """
-    if len(vec_list.shape) == 1:
-        return vec_list / np.linalg.norm(vec_list)
-    elif len(vec_list.shape) == 2:
-        return vec_list / np.linalg.norm(vec_list, axis=1)[:, np.newaxis]
-    else:
+    if vec_list.ndim > 2:
         print('Input "vec_list" must be 1-D or 2-D NumPy array')
+        return
+
+    # Scale by reciprocal norms computed from fused sums of squares along the
+    # last axis, which handles single vectors and arrays of vectors alike
+    inv_norms = 1.0 / np.sqrt(np.einsum("...i,...i->...", vec_list, vec_list))
+
+    return np.multiply(vec_list, inv_norms[..., np.newaxis], out=out)
 
 
 def read_yaml_config(filename):
     """Read YAML file describing ParaStell configuration and extract all data."""
     with open(filename) as yaml_file:
-        all_data = yaml.safe_load(yaml_file)
+        all_data = yaml.load(yaml_file, Loader=_YamlLoader)
 
     return all_data
 
@@ -198,7 +229,16 @@ def reorder_loop(list, index):
     Returns:
         (iterable): reordered closed loop.
     """
-    return np.concatenate([list[index:], list[1 : index + 1]])
+    list = np.asarray(list)
+    reordered_loop = np.empty_like(list)
+
+    # Elements from index through the closing element come first, followed by
+    # those after the first element through index, closing the loop again
+    num_leading = len(list) - index
+    reordered_loop[:num_leading] = list[index:]
+    reordered_loop[num_leading:] = list[1 : index + 1]
+
+    return reordered_loop
 
 
 def smooth_matrix(matrix, steps, sigma):
@@ -213,18 +253,40 @@ def smooth_matrix(matrix, steps, sigma):
     Returns:
         smoothed_matrix (2-D iterable of float): smoothed matrix.
     """
-    previous_matrix = matrix
+    # Work on a private copy so that each step can be clamped in place
+    smoothed_matrix = np.array(matrix, dtype=float)
+
+    if np.max(sigma) < 3:
+        # Narrow kernels are cheaper to apply by direct spatial filtering,
+        # writing each pass into a reused buffer
+        filtered_matrix = np.empty_like(smoothed_matrix)
+
+        def gaussian_smooth(matrix):
+            return gaussian_filter(
+                matrix, sigma=sigma, mode="wrap", output=filtered_matrix
+            )
+
+    else:
+        # Gaussian filtering with wrapped boundaries is a circular convolution,
+        # so compute the filter's impulse response once and apply wide kernels
+        # as a product in frequency space
+        impulse = np.zeros(smoothed_matrix.shape)
+        impulse[0, 0] = 1.0
+        kernel_fft = np.fft.rfft2(
+            gaussian_filter(impulse, sigma=sigma, mode="wrap")
+        )
+
+        def gaussian_smooth(matrix):
+            return np.fft.irfft2(
+                np.fft.rfft2(matrix) * kernel_fft, s=matrix.shape
+            )
 
     for step in range(steps):
-        smoothed_matrix = np.minimum(
-            previous_matrix,
-            gaussian_filter(
-                previous_matrix,
-                sigma=sigma,
-                mode="wrap",
-            ),
+        np.minimum(
+            smoothed_matrix,
+            gaussian_smooth(smoothed_matrix),
+            out=smoothed_matrix,
         )
-        previous_matrix = smoothed_matrix
 
     return smoothed_matrix
 
@@ -281,7 +343,7 @@ class DAGMCRenumberizer(object):
             )
             num_ids = len(category_set)
             if num_ids != 0:
-                set_ids = list(range(1, num_ids + 1))
+                set_ids = np.arange(1, num_ids + 1, dtype=np.int32)
                 self.mb.tag_set_data(
                     self.global_id_tag,
                     category_set,
@@ -301,12 +363,12 @@ def combine_dagmc_models(models_to_merge):
         combined_model (dagmc.DAGModel): Single DAGMC model containing the
             combined individual models.
     """
+    # Stage all models in a single temporary directory, located according to
+    # TMPDIR, when handing them between PyMOAB core instances
     renumberizer = DAGMCRenumberizer()
-    for model in models_to_merge:
-        with tempfile.NamedTemporaryFile(
-            delete=True, suffix=".h5m"
-        ) as temp_file:
-            temp_filename = temp_file.name
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for model_idx, model in enumerate(models_to_merge):
+            temp_filename = str(Path(temp_dir) / f"model_{model_idx}.h5m")
             model.write_file(temp_filename)
             renumberizer.load_file(temp_filename)
     renumberizer.renumber_ids()
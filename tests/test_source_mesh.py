@@ -3,6 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 import pystell.read_vmec as read_vmec
+from pymoab import types
 
 import parastell.source_mesh as sm
 
@@ -126,3 +127,95 @@ def test_export(source_mesh):
     assert Path("source_mesh.h5m").exists()
 
     remove_files()
+
+
+def test_closed_toroidal_wrap(source_mesh):
+    """Tests whether SourceMesh connectivity wraps around a toroidally closed
+    mesh as expected, by testing if:
+        * vertices are only defined on distinct toroidal planes
+        * tetrahedra of the first toroidal slab reference the first two planes
+        * tetrahedra of the final toroidal slab reference the final distinct
+          plane and the first plane
+    """
+    remove_files()
+
+    num_s = 3
+    num_theta = 5
+    num_phi = 5
+
+    tets_per_slab = 3 * (num_theta - 1) + 5 * (num_s - 2) * (num_theta - 1)
+    num_planes_exp = num_phi - 1
+
+    closed_mesh = sm.SourceMesh(
+        source_mesh.vmec_obj, (num_s, num_theta, num_phi), 360.0
+    )
+    closed_mesh.create_vertices()
+    closed_mesh.create_mesh()
+
+    tets = closed_mesh.mbc.get_entities_by_type(
+        closed_mesh.mesh_set, types.MBTET
+    )
+    tet_verts = np.reshape(closed_mesh.mbc.get_connectivity(tets), (-1, 4))
+
+    # Map vertex handles to toroidal plane indices
+    vert_handles = np.fromiter(closed_mesh.verts, dtype=np.uint64)
+    vert_planes = (
+        np.searchsorted(vert_handles, tet_verts) // closed_mesh.verts_per_plane
+    )
+
+    assert len(vert_handles) == num_planes_exp * closed_mesh.verts_per_plane
+    assert set(np.unique(vert_planes[:tets_per_slab])) == {0, 1}
+    assert set(np.unique(vert_planes[-tets_per_slab:])) == {
+        0,
+        num_planes_exp - 1,
+    }
+
+    remove_files()
+
+
+def test_single_precision(source_mesh):
+    """Tests whether SourceMesh computations in single precision behave as
+    expected, by testing if:
+        * source strengths and volumes are stored at the requested precision
+        * vertex coordinates and MOAB tag data remain in double precision
+        * source strengths and volumes match those of double precision
+        * non-floating point precisions are rejected
+    """
+    remove_files()
+
+    source_mesh.create_vertices()
+    source_mesh.create_mesh()
+
+    single_mesh = sm.SourceMesh(
+        source_mesh.vmec_obj, (6, 41, 9), 15.0, dtype="float32"
+    )
+    single_mesh.create_vertices()
+    single_mesh.create_mesh()
+
+    tets = single_mesh.mbc.get_entities_by_type(
+        single_mesh.mesh_set, types.MBTET
+    )
+    tagged_strengths = single_mesh.mbc.tag_get_data(
+        single_mesh.source_strength_tag, tets
+    )
+    tagged_volumes = single_mesh.mbc.tag_get_data(single_mesh.volume_tag, tets)
+
+    assert single_mesh.strengths.dtype == np.float32
+    assert single_mesh.volumes.dtype == np.float32
+    assert single_mesh.coords.dtype == np.float64
+    assert tagged_strengths.dtype == np.float64
+    assert tagged_volumes.dtype == np.float64
+    assert np.allclose(
+        single_mesh.strengths, source_mesh.strengths, rtol=1e-5, atol=0
+    )
+    assert np.allclose(
+        single_mesh.volumes, source_mesh.volumes, rtol=1e-5, atol=0
+    )
+    assert np.allclose(
+        tagged_strengths.flatten(), source_mesh.strengths, rtol=1e-5, atol=0
+    )
+
+    with pytest.raises(AttributeError):
+        sm.SourceMesh(source_mesh.vmec_obj, (6, 41, 9), 15.0, dtype="int32")
+
+    remove_files()